@@ -8,18 +8,39 @@ Copyright (c) 2026 Arty McLabin
 """
 
 import tkinter as tk
-from tkinter import messagebox
-import threading
 import time
-from datetime import datetime
-from openpyxl import Workbook, load_workbook
-from openpyxl.styles import PatternFill, Font
+import json
 import os
-import re
+import shutil
+import string
 import sys
 import configparser
 
 class TimeTracker:
+    # Excel column order: Date, Day of Week, Time, Activity, Energy, Value, Interval
+    HEADERS = ('Date', 'Day', 'Time', 'Activity', 'Energy', 'Value', 'Interval')
+
+    # Date lookup tables (fixed English names, independent of locale)
+    _MONTHS = ('jan', 'feb', 'mar', 'apr', 'may', 'jun', 'jul', 'aug', 'sep', 'oct', 'nov', 'dec')
+    _DAYS = ('Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday')
+
+    # Zero-padded seconds for the countdown display
+    _SECONDS = tuple(f'{secs:02d}' for secs in range(60))
+
+    # Control characters xlsx (XML) can't store, mapped for deletion with str.translate
+    _XML_ILLEGAL = dict.fromkeys([*range(0x00, 0x09), 0x0b, 0x0c, *range(0x0e, 0x20)])
+
+    # Refresh the Excel file after this many new entries (always on open/close)
+    REBUILD_EVERY = 20
+
+    # Entry parser tables
+    _COLOR_MAP = {'g': 'green', 'r': 'red', 'w': 'white'}
+    # Tokens that are a color on their own
+    _COLOR_TOKENS = {**_COLOR_MAP, **{color: color for color in _COLOR_MAP.values()}}
+    # Characters that make g/r/w part of another word (ASCII letters in any case,
+    # plus the non-ASCII letters that case-fold onto them)
+    _LETTERS = frozenset(string.ascii_letters + 'İıſK')
+
     def __init__(self):
         self.root = tk.Tk()
         self.root.title("TimeAudit - 15:00")
@@ -28,17 +49,33 @@ class TimeTracker:
         # Get script directory for Excel file and config
         self.script_dir = os.path.dirname(os.path.abspath(__file__))
         self.excel_file = os.path.join(self.script_dir, "time_audit.xlsx")
+        self.journal = os.path.join(self.script_dir, "time_audit.jsonl")
+        self.rejected_excel_file = os.path.join(self.script_dir, "time_audit_rejected.xlsx")
         self.config_file = os.path.join(self.script_dir, "settings.ini")
+        self.state_file = os.path.join(self.script_dir, "time_audit_state.ini")
 
         # Load settings
         self.timer_minutes = self.load_settings()
 
+        # Color mapping for Excel, built on first rebuild (openpyxl is imported lazily)
+        self.color_fills = None
+
         self.setup_excel()
 
+        # Journal stays open for the whole session; line buffering flushes each entry
+        self._journal_stream = open(self.journal, 'a', encoding='utf-8', buffering=1)
+
         # Timer setup - single timer, no duplication
-        self.timer_start_time = None
-        self.timer_running = False
-        self.has_popped = False
+        self._deadline = None
+        self._parked = False
+        self._tick_id = None
+
+        # Last values sent to the timer label, to skip redundant Tk updates
+        self._last_label_text = None
+        self._last_label_fg = None
+        self._last_mins = None
+        self._label_prefix = ''
+        self._title_prefix = ''
 
         # Last entry tracking for prefill
         self.last_color = None
@@ -47,12 +84,8 @@ class TimeTracker:
         # Track last restore time to prevent immediate re-minimize
         self.last_restore_time = 0
 
-        # Color mapping for Excel
-        self.color_fills = {
-            'green': PatternFill(start_color='90EE90', end_color='90EE90', fill_type='solid'),
-            'red': PatternFill(start_color='FFB6C1', end_color='FFB6C1', fill_type='solid'),
-            'white': PatternFill(start_color='FFFFFF', end_color='FFFFFF', fill_type='solid')
-        }
+        # Set once closing has reported a failed Excel update
+        self._close_warned = False
 
         self.setup_ui()
         self.reset_timer()
@@ -81,21 +114,207 @@ class TimeTracker:
             config.write(f)
 
     def setup_excel(self):
-        """Initialize Excel file with headers if it doesn't exist"""
-        if not os.path.exists(self.excel_file):
-            wb = Workbook()
-            ws = wb.active
-            ws.title = "Time Audit"
+        """Load the entry journal, importing an existing Excel file once.
+        Entries are kept in memory and appended to the journal as they are
+        logged; the Excel file is regenerated from memory on demand
+        (Open Excel / on close).
+        """
+        new_file = False
+        imported = False
+        if not os.path.exists(self.journal):
+            if os.path.exists(self.excel_file):
+                # Carry over rows logged before the journal existed. Keep the
+                # original file once, since rebuilds only write the tracked columns
+                backup_file = self.excel_file + '.bak'
+                if not os.path.exists(backup_file):
+                    shutil.copy2(self.excel_file, backup_file)
+                self._write_journal(self._read_xlsx_entries())
+                imported = True
+            else:
+                open(self.journal, 'w', encoding='utf-8').close()
+                new_file = True
+
+        self.entries = []
+        with open(self.journal, encoding='utf-8') as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                try:
+                    self.entries.append(json.loads(line))
+                except json.JSONDecodeError:
+                    # Partial line left by an interrupted write
+                    continue
 
-            # Headers - Date, Day of Week, Time, Activity, Energy, Value, Interval
-            headers = ['Date', 'Day', 'Time', 'Activity', 'Energy', 'Value', 'Interval']
-            ws.append(headers)
+        # The state file holds the Excel mtime and entry count from the last
+        # rebuild or merge. An Excel file with a different mtime was edited
+        # since, and the next rebuild merges those edits instead of overwriting them.
+        self._batch_count = 0
+        state = None if imported else self._load_sync_state()
+        if state:
+            self._xlsx_mtime, synced_count = state
+            self._synced_count = min(synced_count, len(self.entries))
+        else:
+            # Freshly imported, or nothing recorded: the Excel file counts as synced
+            self._synced_count = len(self.entries)
+            self._xlsx_mtime = None
+            if os.path.exists(self.excel_file):
+                self._xlsx_mtime = os.stat(self.excel_file).st_mtime_ns
+                self._save_sync_state()
+
+        # Excel file needs regenerating if it is missing or entries were logged since
+        self._dirty = (not os.path.exists(self.excel_file)
+                       or len(self.entries) > self._synced_count)
+
+        if new_file:
+            self._rebuild_xlsx()
+
+    def _load_sync_state(self):
+        """Load (Excel mtime, synced entry count) from the state file, or None"""
+        if not os.path.exists(self.state_file):
+            return None
 
-            # Make headers bold
-            for cell in ws[1]:
-                cell.font = Font(bold=True)
+        config = configparser.ConfigParser()
+        try:
+            config.read(self.state_file)
+            return (config.getint('Excel', 'mtime_ns'),
+                    config.getint('Excel', 'synced_entries'))
+        except (configparser.Error, ValueError):
+            return None
 
-            wb.save(self.excel_file)
+    def _save_sync_state(self):
+        """Save the Excel mtime and entry count of the last rebuild or merge"""
+        config = configparser.ConfigParser()
+        config['Excel'] = {
+            'mtime_ns': str(self._xlsx_mtime),
+            'synced_entries': str(self._synced_count)
+        }
+
+        with open(self.state_file, 'w') as f:
+            config.write(f)
+
+    def _read_xlsx_entries(self, check_headers=False):
+        """Read entry rows from the Excel file, keyed by lowercased header.
+        With check_headers, raise ValueError unless the first row starts with HEADERS.
+        """
+        from openpyxl import load_workbook
+
+        wb = load_workbook(self.excel_file, read_only=True)
+        try:
+            rows = wb.active.iter_rows(values_only=True)
+            keys = [str(title).strip().lower() for title in next(rows, ())]
+            if check_headers and keys[:len(self.HEADERS)] != [title.lower() for title in self.HEADERS]:
+                raise ValueError('first row is not the Date/Day/Time/... header')
+
+            entries = []
+            for row in rows:
+                if all(value is None for value in row):
+                    continue
+                entries.append(dict(zip(keys, row)))
+        finally:
+            wb.close()
+        return entries
+
+    def _write_journal(self, entries):
+        """Replace the journal with the given entries.
+        Writes to a temp file first so a failed write keeps the old journal.
+        """
+        temp_journal = self.journal + '.tmp'
+        with open(temp_journal, 'w', encoding='utf-8') as f:
+            for entry in entries:
+                f.write(json.dumps(entry, ensure_ascii=False, default=str) + '\n')
+        os.replace(temp_journal, self.journal)
+
+    def _merge_external_edits(self):
+        """Adopt rows edited in Excel, keeping entries logged since the last rebuild"""
+        xlsx_entries = self._read_xlsx_entries(check_headers=True)
+        entries = xlsx_entries + self.entries[self._synced_count:]
+
+        # Windows can't replace a file that is still open
+        self._journal_stream.close()
+        try:
+            self._write_journal(entries)
+        finally:
+            self._journal_stream = open(self.journal, 'a', encoding='utf-8', buffering=1)
+        self.entries = entries
+
+        # The edits are in the journal now; if the following save fails, the
+        # next rebuild must not merge the same Excel file again
+        self._synced_count = len(xlsx_entries)
+        self._xlsx_mtime = os.stat(self.excel_file).st_mtime_ns
+        self._save_sync_state()
+
+    def _rebuild_xlsx(self):
+        """Regenerate the Excel file from the in-memory entries using a write-only workbook.
+        Returns a warning message if edits made in Excel could not be merged, else None.
+        """
+        from openpyxl import Workbook
+        from openpyxl.cell import WriteOnlyCell
+        from openpyxl.styles import NamedStyle, PatternFill, Font
+
+        # Only re-read the Excel file if it changed since it was last written here.
+        # A file that can't be read back (missing header, not a valid xlsx) is
+        # copied aside and never written to the journal.
+        merge_warning = None
+        if os.path.exists(self.excel_file) and os.stat(self.excel_file).st_mtime_ns != self._xlsx_mtime:
+            try:
+                self._merge_external_edits()
+            except Exception as e:
+                shutil.copy2(self.excel_file, self.rejected_excel_file)
+                merge_warning = (f'⚠️ Excel edits not merged ({str(e)}); '
+                                 f'copy kept as {os.path.basename(self.rejected_excel_file)}')
+
+        if self.color_fills is None:
+            self.color_fills = {
+                'green': PatternFill(start_color='FF90EE90', end_color='FF90EE90', fill_type='solid'),
+                'red': PatternFill(start_color='FFFFB6C1', end_color='FFFFB6C1', fill_type='solid'),
+                'white': PatternFill(start_color='FFFFFFFF', end_color='FFFFFFFF', fill_type='solid')
+            }
+
+        wb = Workbook(write_only=True)
+        ws = wb.create_sheet("Time Audit")
+
+        # One named style per color, registered once so each cell only references it
+        row_styles = {}
+        for color, fill in self.color_fills.items():
+            row_style = NamedStyle(name=f'{color}_row')
+            row_style.fill = fill
+            wb.add_named_style(row_style)
+            row_styles[color] = row_style.name
+
+        # Bold headers
+        header_font = Font(bold=True)
+        header_cells = []
+        for title in self.HEADERS:
+            cell = WriteOnlyCell(ws, value=title)
+            cell.font = header_font
+            header_cells.append(cell)
+        ws.append(header_cells)
+
+        keys = [title.lower() for title in self.HEADERS]
+        for entry in self.entries:
+            # Apply color to the entire row
+            row_style = row_styles.get(str(entry.get('energy', '')).lower())
+            row_cells = []
+            for key in keys:
+                value = entry.get(key)
+                # One bad value in the journal must not block the whole export
+                if isinstance(value, str):
+                    value = value.translate(self._XML_ILLEGAL)
+                cell = WriteOnlyCell(ws, value=value)
+                if row_style:
+                    cell.style = row_style
+                row_cells.append(cell)
+            ws.append(row_cells)
+
+        wb.save(self.excel_file)
+        self._dirty = False
+        self._batch_count = 0
+
+        # Remember what was written so later external edits can be detected
+        self._xlsx_mtime = os.stat(self.excel_file).st_mtime_ns
+        self._synced_count = len(self.entries)
+        self._save_sync_state()
+        return merge_warning
 
     def setup_ui(self):
         """Create the UI"""
@@ -269,39 +488,57 @@ class TimeTracker:
 
     def reset_timer(self):
         """Reset the timer to start a new 15-minute countdown"""
-        self.timer_start_time = time.time()
-        self.has_popped = False
-        self.timer_running = True
+        self._deadline = time.perf_counter() + self.timer_minutes * 60
 
-    def start_timer_display(self):
-        """Single timer thread that updates display and handles popup"""
-        def timer_loop():
-            while True:
-                if not self.timer_running:
-                    time.sleep(0.1)
-                    continue
+        # Wake the countdown loop if it parked after popping up
+        if self._parked:
+            self._parked = False
+            self._tick()
 
-                elapsed = time.time() - self.timer_start_time
-                remaining = (self.timer_minutes * 60) - elapsed
-
-                if remaining <= 0:
-                    if not self.has_popped:
-                        self.pop_window()
-                        self.has_popped = True
-                    # Keep showing alert until user submits
-                    self.timer_label.config(text="⏰ TIME TO LOG! ⏰", fg='#e94560')
-                    self.root.title("Clock Now!")
-                else:
-                    mins, secs = divmod(int(remaining), 60)
-                    time_str = f"Next reminder in: {mins:02d}:{secs:02d}"
-                    self.timer_label.config(text=time_str, fg='#4ecca3')
-                    # Update window title with remaining time
-                    self.root.title(f"TimeAudit - {mins:02d}:{secs:02d}")
-
-                time.sleep(1)
+    def start_timer_display(self):
+        """Start the countdown loop on the Tk event loop"""
+        self._tick()
+
+    def _tick(self):
+        """Update the countdown display, then re-arm until the popup fires"""
+        remaining = self._deadline - time.perf_counter()
+
+        if remaining <= 0:
+            self.pop_window()
+            # Alert stays up until user submits; nothing changes until then,
+            # so park instead of re-arming - reset_timer wakes the loop
+            self._set_timer_label("⏰ TIME TO LOG! ⏰", '#e94560')
+            self.root.title("Clock Now!")
+            self._parked = True
+            self._tick_id = None
+            return
 
-        timer_thread = threading.Thread(target=timer_loop, daemon=True)
-        timer_thread.start()
+        mins, secs = divmod(int(remaining), 60)
+        # Minute prefixes are rebuilt once a minute; seconds come from a table
+        if mins != self._last_mins:
+            self._last_mins = mins
+            self._label_prefix = f"Next reminder in: {mins:02d}:"
+            self._title_prefix = f"TimeAudit - {mins:02d}:"
+        secs_str = self._SECONDS[secs]
+        self._set_timer_label(self._label_prefix + secs_str, '#4ecca3')
+        # Update window title with remaining time
+        self.root.title(self._title_prefix + secs_str)
+
+        # Wake just after the displayed second rolls over, so the display
+        # tracks the deadline without a fixed polling rate
+        self._tick_id = self.root.after(int((remaining % 1) * 1000) + 1, self._tick)
+
+    def _set_timer_label(self, text, fg):
+        """Update the timer label, passing only the options that changed"""
+        options = {}
+        if text != self._last_label_text:
+            options['text'] = text
+            self._last_label_text = text
+        if fg != self._last_label_fg:
+            options['fg'] = fg
+            self._last_label_fg = fg
+        if options:
+            self.timer_label.config(**options)
 
     def pop_window(self):
         """Bring window to foreground (pop up)"""
@@ -324,35 +561,81 @@ class TimeTracker:
         if not line:
             return None
 
-        # Find color with proper word boundaries
-        # Full names need \b, single letters need to not be part of another word
-        color_pattern = r'\b(green|red|white)\b|(?<![a-zA-Z])(g|r|w)(?![a-zA-Z])'
-        color_match = re.search(color_pattern, line, re.IGNORECASE)
-        if not color_match:
+        # Left-to-right over whitespace-separated tokens: take the first color
+        # and the first run of dollar signs, drop every other '$', keep the rest
+        # as activity. Plain words are taken whole; only tokens that may hold a
+        # color or '$' are scanned character by character.
+        color = None
+        dollars = None
+        activity = []
+        for token in line.split():
+            if color is None:
+                whole = self._COLOR_TOKENS.get(token.lower())
+                if whole:
+                    color = whole
+                    continue
+                plain = token.isascii() and token.isalpha()
+            else:
+                plain = '$' not in token
+            if plain:
+                activity.append(token)
+                continue
+
+            token_color, token_dollars, rest = self._scan_token(token, color is None)
+            if token_color:
+                color = token_color
+            if dollars is None:
+                dollars = token_dollars
+            if rest:
+                activity.append(rest)
+
+        if color is None or dollars is None or not activity:
             return None
 
-        # Get matched color from either group 1 or 2
-        color_raw = (color_match.group(1) or color_match.group(2)).lower()
-        color_map = {'g': 'green', 'r': 'red', 'w': 'white'}
-        color = color_map.get(color_raw, color_raw)
+        return (color, dollars, ' '.join(activity))
 
-        # Find dollar signs
-        dollars_match = re.search(r'\$+', line)
-        if not dollars_match:
-            return None
-        dollars = dollars_match.group(0)
-
-        # Remove color and dollars from line to get activity
-        # Remove the exact color match at its position (only once)
-        activity = line[:color_match.start()] + line[color_match.end():]
-        # Remove all dollar signs
-        activity = re.sub(r'\$+', '', activity)
-        activity = ' '.join(activity.split())  # Clean up extra whitespace
+    def _scan_token(self, token, find_color):
+        """Scan one token for a color and dollar signs.
+        Returns: (color or None, first run of '$' or None, remaining text)
+        """
+        color = None
+        dollars = None
+        rest = []
+        n = len(token)
+        i = 0
+        while i < n:
+            ch = token[i]
+
+            if ch == '$':
+                start = i
+                while i < n and token[i] == '$':
+                    i += 1
+                if dollars is None:
+                    dollars = token[start:i]
+                continue
+
+            word = self._COLOR_MAP.get(ch.lower()) if find_color and color is None else None
+            if word:
+                prev = token[i - 1] if i else ' '
+                end = i + len(word)
+                # Full names need word boundaries
+                if (token[i:end].lower() == word
+                        and not (prev.isalnum() or prev == '_')
+                        and not (end < n and (token[end].isalnum() or token[end] == '_'))):
+                    color = word
+                    i = end
+                    continue
+                # Single letters need to not be part of another word
+                nxt = token[i + 1] if i + 1 < n else ' '
+                if prev not in self._LETTERS and nxt not in self._LETTERS:
+                    color = word
+                    i += 1
+                    continue
 
-        if not activity:
-            return None
+            rest.append(ch)
+            i += 1
 
-        return (color, dollars, activity)
+        return (color, dollars, ''.join(rest))
 
     def submit_entry(self):
         """Process and save entry to Excel"""
@@ -361,8 +644,8 @@ class TimeTracker:
         if not text:
             return
 
-        # Parse entry
-        parsed = self.parse_entry(text)
+        # Parse entry, dropping pasted control characters Excel can't store
+        parsed = self.parse_entry(text.translate(self._XML_ILLEGAL))
 
         if not parsed:
             self.status_label.config(
@@ -371,32 +654,42 @@ class TimeTracker:
             )
             return
 
-        # Save to Excel
+        # Append to the journal - the Excel file is rebuilt from it on demand
         try:
-            wb = load_workbook(self.excel_file)
-            ws = wb.active
-
-            now = datetime.now()
-            # Date format: 1jan2026
-            date_str = now.strftime("%d%b%Y").lower()
+            now = time.localtime()
+            # Date format: 01jan2026
+            date_str = f"{now.tm_mday:02d}{self._MONTHS[now.tm_mon - 1]}{now.tm_year}"
             # Day of week: Monday, Tuesday, etc.
-            day_of_week = now.strftime("%A")
+            day_of_week = self._DAYS[now.tm_wday]
             # Time format: 14:05
-            time_str = now.strftime("%H:%M")
+            time_str = f"{now.tm_hour:02d}:{now.tm_min:02d}"
 
             color, dollars, activity = parsed
 
-            # Column order: Date, Day, Time, Activity, Energy, Value, Interval
-            row = [date_str, day_of_week, time_str, activity, color.capitalize(), dollars, self.timer_minutes]
-            ws.append(row)
-
-            # Apply color to the entire row
-            row_num = ws.max_row
-            for col in range(1, 8):  # 7 columns total
-                cell = ws.cell(row=row_num, column=col)
-                cell.fill = self.color_fills[color]
-
-            wb.save(self.excel_file)
+            # Keys follow the Excel column order
+            entry = {
+                'date': date_str,
+                'day': day_of_week,
+                'time': time_str,
+                'activity': activity,
+                'energy': color.capitalize(),
+                'value': dollars,
+                'interval': self.timer_minutes
+            }
+            self._journal_stream.write(json.dumps(entry, ensure_ascii=False) + '\n')
+            self.entries.append(entry)
+            self._dirty = True
+            self._batch_count += 1
+
+            # Amortise the Excel rebuild over a batch of entries; if it fails
+            # (e.g. file open in Excel) the entry stays saved in the journal
+            # and the rebuild is retried with the next entry
+            excel_warning = None
+            if self._batch_count >= self.REBUILD_EVERY:
+                try:
+                    excel_warning = self._rebuild_xlsx()
+                except Exception as e:
+                    excel_warning = f'⚠️ Saved; Excel not updated: {str(e)}'
 
             # Store last entry for prefill
             self.last_color = color
@@ -413,11 +706,14 @@ class TimeTracker:
             # Reset timer - single timer, just reset the start time
             self.reset_timer()
 
-            # Show success with timestamp
-            self.status_label.config(
-                text=f'✓ Saved at {date_str} {time_str}: {color.upper()} {dollars} {activity}',
-                fg='#4ecca3'
-            )
+            # Show success with timestamp, or the Excel warning
+            if excel_warning:
+                self.status_label.config(text=excel_warning, fg='#f3a683')
+            else:
+                self.status_label.config(
+                    text=f'✓ Saved at {date_str} {time_str}: {color.upper()} {dollars} {activity}',
+                    fg='#4ecca3'
+                )
 
         except Exception as e:
             self.status_label.config(
@@ -427,6 +723,26 @@ class TimeTracker:
 
     def open_excel(self):
         """Open the Excel file with the default application"""
+        if self._dirty or not os.path.exists(self.excel_file):
+            try:
+                merge_warning = self._rebuild_xlsx()
+            except Exception as e:
+                self.status_label.config(
+                    text=f'❌ Failed to update Excel: {str(e)}',
+                    fg='#e94560'
+                )
+                return
+
+            # Without lxml openpyxl falls back to its slower pure-Python XML writer
+            from openpyxl.xml import LXML
+            if merge_warning:
+                self.status_label.config(text=merge_warning, fg='#f3a683')
+            elif not LXML:
+                self.status_label.config(
+                    text='⚠️ Install lxml to speed up Excel saves: pip install lxml',
+                    fg='#f3a683'
+                )
+
         if os.path.exists(self.excel_file):
             try:
                 os.startfile(self.excel_file)
@@ -477,7 +793,7 @@ class TimeTracker:
 
     def on_focus_gained(self, event=None):
         """Track when window gains focus (restored from minimized)"""
-        self.last_restore_time = time.time()
+        self.last_restore_time = time.perf_counter()
 
     def on_focus_lost(self, event=None):
         """Minimize window when clicking outside"""
@@ -486,7 +802,7 @@ class TimeTracker:
             return
 
         # Don't minimize if we just restored (within 0.5 seconds)
-        time_since_restore = time.time() - self.last_restore_time
+        time_since_restore = time.perf_counter() - self.last_restore_time
         if time_since_restore < 0.5:
             return
 
@@ -502,8 +818,26 @@ class TimeTracker:
         )
 
     def on_closing(self):
-        """Handle window close event - no confirmation"""
-        self.timer_running = False
+        """Handle window close event - no confirmation unless the Excel update fails"""
+        # Bring the Excel file up to date; the journal keeps every entry regardless.
+        # If that fails, say so once and let a second close quit anyway
+        if self._dirty and not self._close_warned:
+            try:
+                self._rebuild_xlsx()
+            except Exception as e:
+                self._close_warned = True
+                self.status_label.config(
+                    text=f'⚠️ Excel not updated: {str(e)} - close again to quit (entries are kept)',
+                    fg='#f3a683'
+                )
+                return
+        self._journal_stream.close()
+
+        # Stop the countdown loop so no tick fires during teardown
+        if self._tick_id is not None:
+            self.root.after_cancel(self._tick_id)
+            self._tick_id = None
+
         self.root.destroy()
         sys.exit(0)
 